@@ -0,0 +1,67 @@
+"""
+Resident memory per active call.
+
+Builds N inbound calls, each holding the components, actions and results a
+typical IVR keeps alive (play, prompt and record in flight), and reports the
+bytes allocated per call according to tracemalloc.
+
+  python benchmarks/memory.py [--calls 10000]
+"""
+import argparse
+import asyncio
+import gc
+import tracemalloc
+from signalwire.relay.client import Client
+from signalwire.relay.calling import Call
+from signalwire.relay.calling.components.play import Play
+from signalwire.relay.calling.components.prompt import Prompt
+from signalwire.relay.calling.components.record import Record
+from signalwire.relay.calling.actions.play_action import PlayAction
+from signalwire.relay.calling.actions.prompt_action import PromptAction
+from signalwire.relay.calling.actions.record_action import RecordAction
+from signalwire.relay.calling.results.play_result import PlayResult
+from signalwire.relay.event import Event
+from signalwire.tests import MockedConnection
+
+def build_call(calling, index):
+  call = Call(calling=calling, **{
+    'call_id': f'call-{index}',
+    'node_id': 'node-id',
+    'context': 'office',
+    'call_state': 'answered',
+    'device': { 'type': 'phone', 'params': { 'from_number': '+12029999999', 'to_number': '+12028888888' } }
+  })
+  play = Play(call, [{ 'type': 'audio', 'url': 'https://example.com/welcome.mp3' }])
+  play.register()
+  play.event = Event('finished', { 'state': 'finished' })
+  prompt = Prompt(call, 'digits', [{ 'type': 'tts', 'text': 'Press 1' }], digits_max=1)
+  prompt.register()
+  record = Record(call, 'audio', None, None, None, None, None, None, None)
+  record.register()
+  return [call, PlayResult(play), PlayAction(play), PromptAction(prompt), RecordAction(record)]
+
+def main():
+  parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+  parser.add_argument('--calls', type=int, default=10000)
+  args = parser.parse_args()
+
+  asyncio.set_event_loop(asyncio.new_event_loop())
+  client = Client(project='project', token='token', connection=MockedConnection)
+  calling = client.calling
+
+  gc.collect()
+  tracemalloc.start()
+  before = tracemalloc.take_snapshot()
+  live = [build_call(calling, index) for index in range(args.calls)]
+  gc.collect()
+  after = tracemalloc.take_snapshot()
+  tracemalloc.stop()
+
+  allocated = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+  print(f'calls:          {len(live)}')
+  print(f'handlers:       {client.bus.handler_stats()["handlers"]}')
+  print(f'bytes/call:     {allocated / len(live):.0f}')
+  print(f'total (MiB):    {allocated / 2**20:.1f}')
+
+if __name__ == '__main__':
+  main()
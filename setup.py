@@ -43,6 +43,10 @@ setup(
     'aiohttp',
     'asyncio'
   ],
+  extras_require={
+    'orjson': ['orjson'],
+    'ujson': ['ujson']
+  },
   python_requires='>=3.6',
   zip_safe=False
 )
@@ -0,0 +1,63 @@
+import json
+
+try:
+  import orjson
+except ImportError:
+  orjson = None
+
+try:
+  import ujson
+except ImportError:
+  ujson = None
+
+class JsonCodec:
+  name = 'json'
+
+  def dumps(self, obj):
+    return json.dumps(obj, separators=(',', ':'))
+
+  def dumps_bytes(self, obj):
+    return self.dumps(obj).encode('utf-8')
+
+  def loads(self, data):
+    return json.loads(data)
+
+class UjsonCodec(JsonCodec):
+  name = 'ujson'
+
+  def dumps(self, obj):
+    return ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False)
+
+  def loads(self, data):
+    return ujson.loads(data)
+
+class OrjsonCodec(JsonCodec):
+  name = 'orjson'
+
+  def dumps(self, obj):
+    return orjson.dumps(obj).decode('utf-8')
+
+  def dumps_bytes(self, obj):
+    return orjson.dumps(obj)
+
+  def loads(self, data):
+    return orjson.loads(data)
+
+_codecs = {
+  'orjson': OrjsonCodec if orjson is not None else None,
+  'ujson': UjsonCodec if ujson is not None else None,
+  'json': JsonCodec
+}
+
+def get_codec(codec=None):
+  if isinstance(codec, JsonCodec):
+    return codec
+  if codec is None:
+    return default_codec
+  if codec not in _codecs:
+    raise ValueError(f'Unknown JSON codec: {codec}')
+  if _codecs[codec] is None:
+    raise ValueError(f'JSON codec {codec} is not installed')
+  return _codecs[codec]()
+
+default_codec = next(cls() for cls in _codecs.values() if cls is not None)
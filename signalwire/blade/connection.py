@@ -1,14 +1,19 @@
 from aiohttp import WSMsgType, ClientSession, ClientWebSocketResponse
 import logging
 import re
-from signalwire.blade.messages.message import Message
+from signalwire.blade.messages.lazy import LazyMessage
+from signalwire.blade.wire_log import WireLog
 
 class Connection:
+  WIRE_LOG_SAMPLE_RATE = 1.0 # share of frames written to the DEBUG log
+  FRAME_BUFFER_SIZE = 100 # last frames kept in memory and dumped on socket errors
+
   def __init__(self, client, session=ClientSession):
     self._session = session()
     self.client = client
     self.host = self._checkHost(client.host)
     self.ws = None
+    self.wire_log = WireLog(self.WIRE_LOG_SAMPLE_RATE, self.FRAME_BUFFER_SIZE)
     self._requests = {}
 
   @property
@@ -21,24 +26,33 @@ class Connection:
     return protocol + host
 
   async def send(self, message):
-    logging.debug('SEND: \n' + message.to_json(indent=2))
-    await self.ws.send_str(message.to_json())
+    data = message.to_bytes(self.client.codec)
+    self.wire_log.sent(data)
+    if hasattr(self.ws, 'send_frame'):
+      await self.ws.send_frame(data, WSMsgType.TEXT)
+    else: # aiohttp < 3.11
+      await self.ws.send_str(data.decode('utf-8'))
 
   async def connect(self):
     logging.debug('Connecting to: {0}'.format(self.host))
     self.ws = await self._session.ws_connect(self.host)
 
   async def read(self):
-    async for msg in self.ws:
-      logging.debug('RECV: \n' + msg.data)
-      if msg.type == WSMsgType.TEXT:
-        self.client.message_handler(Message.from_json(msg.data))
-      elif msg.type == WSMsgType.CLOSED:
-        logging.info('WebSocket Closed!')
-        break
-      elif msg.type == WSMsgType.ERROR:
-        logging.info('WebSocket Error!')
-        break
+    try:
+      async for msg in self.ws:
+        if msg.type == WSMsgType.TEXT:
+          self.wire_log.received(msg.data)
+          self.client.message_handler(LazyMessage(msg.data, self.client.codec))
+        elif msg.type == WSMsgType.CLOSED:
+          logging.info('WebSocket Closed!')
+          break
+        elif msg.type == WSMsgType.ERROR:
+          logging.info('WebSocket Error!')
+          self.wire_log.dump()
+          break
+    except Exception:
+      self.wire_log.dump()
+      raise
 
   async def close(self):
     if self.connected:
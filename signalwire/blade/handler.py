@@ -1,79 +1,159 @@
+import heapq
+import weakref
+from types import MethodType
 from .helpers import safe_invoke_callback
 
 GLOBAL = 'GLOBAL'
-_queue = {}
 
-def register(*, event, callback, suffix=GLOBAL):
-  global _queue
-
-  event = build_event_name(event, suffix)
-  if event not in _queue:
-    _queue[event] = []
-  _queue[event].append(callback)
+class EventBus:
+  def __init__(self):
+    self._queue = {} # (event, suffix) -> [callbacks]
+    self._index = {} # event -> {suffixes}
+
+  def register(self, *, event, callback, suffix=GLOBAL, weak=False):
+    key = build_event_key(event, suffix)
+    # the caller's callback stays referenced until the end: a weak handler whose
+    # referent dies earlier would be reclaimed before its bucket exists
+    handler = self._weak_callback(key, callback) if weak else callback
+    handlers = self._queue.get(key)
+    if handlers is None:
+      handlers = self._queue[key] = []
+      self._index.setdefault(key[0], set()).add(key[1])
+    handlers.append(handler)
+
+  def register_once(self, *, event, callback, suffix=GLOBAL):
+    def cb(*args):
+      self.unregister(event=event, callback=cb, suffix=suffix)
+      callback(*args)
+
+    self.register(event=event, callback=cb, suffix=suffix)
+
+  def unregister(self, *, event, callback=None, suffix=GLOBAL):
+    key = build_event_key(event, suffix)
+    handlers = self._queue.get(key)
+    if not handlers:
+      return False
+    if callback is None:
+      handlers.clear()
+    else:
+      handlers[:] = [handler for handler in handlers if _resolve(handler) != callback]
+
+    if len(handlers) == 0:
+      self._remove_key(key)
+
+    return True
+
+  def unregister_all(self, event):
+    event = event.strip()
+    for suffix in self._index.pop(event, ()):
+      self._queue.pop((event, suffix), None)
+
+  def trigger(self, event, *args, suffix=GLOBAL, **kwargs):
+    handlers = self._queue.get(build_event_key(event, suffix))
+    if not handlers:
+      return False
+    # copy: handlers registered with register_once remove themselves while dispatching
+    for callback in tuple(handlers):
+      if isinstance(callback, weakref.ref):
+        callback = callback()
+        if callback is None:
+          continue
+      safe_invoke_callback(callback, *args, **kwargs)
+    return True
+
+  def has_listeners(self, event):
+    return event.strip() in self._index
+
+  def is_queued(self, event, suffix=GLOBAL):
+    return bool(self._queue.get(build_event_key(event, suffix)))
+
+  def queue_size(self, event, suffix=GLOBAL):
+    handlers = self._queue.get(build_event_key(event, suffix))
+    return len(handlers) if handlers else 0
+
+  def clear(self):
+    self._queue = {}
+    self._index = {}
+
+  def handler_stats(self, top=10):
+    per_event = {}
+    for (event, _), handlers in self._queue.items():
+      per_event[event] = per_event.get(event, 0) + len(handlers)
+    return {
+      'buckets': len(self._queue),
+      'handlers': sum(per_event.values()),
+      'top_prefixes': heapq.nlargest(top, per_event.items(), key=lambda item: item[1])
+    }
+
+  def _weak_callback(self, key, callback):
+    return _WeakHandler(callback, key, self._reclaim)
+
+  def _reclaim(self, ref):
+    handlers = self._queue.get(ref.key)
+    if handlers is None:
+      return
+    handlers[:] = [handler for handler in handlers if handler is not ref]
+    if len(handlers) == 0:
+      self._remove_key(ref.key)
+
+  def _remove_key(self, key):
+    del self._queue[key]
+    suffixes = self._index.get(key[0])
+    if suffixes is not None:
+      suffixes.discard(key[1])
+      if len(suffixes) == 0:
+        del self._index[key[0]]
+
+class _WeakHandler(weakref.ref):
+  # Lighter than WeakMethod: one weakref to the instance and no per-handler closure
+  __slots__ = ('func', 'key')
+
+  def __new__(cls, callback, key, reclaim):
+    return super().__new__(cls, getattr(callback, '__self__', callback), reclaim)
+
+  def __init__(self, callback, key, reclaim):
+    super().__init__(getattr(callback, '__self__', callback), reclaim)
+    self.func = getattr(callback, '__func__', None)
+    self.key = key
+
+  def __call__(self):
+    target = super().__call__()
+    if target is None or self.func is None:
+      return target
+    return MethodType(self.func, target)
+
+def build_event_key(event, suffix):
+  return (event.strip(), suffix.strip())
+
+def _resolve(handler):
+  return handler() if isinstance(handler, weakref.ref) else handler
+
+# Process-wide bus kept for code using the module-level API
+_bus = EventBus()
+
+def register(*, event, callback, suffix=GLOBAL, weak=False):
+  _bus.register(event=event, callback=callback, suffix=suffix, weak=weak)
 
 def register_once(*, event, callback, suffix=GLOBAL):
-  global _queue
-
-  def cb(*args):
-    unregister(event=event, callback=cb, suffix=suffix)
-    callback(*args)
-
-  register(event=event, callback=cb, suffix=suffix)
+  _bus.register_once(event=event, callback=callback, suffix=suffix)
 
 def unregister(*, event, callback=None, suffix=GLOBAL):
-  global _queue
-
-  if is_queued(event, suffix) is False:
-    return False
-  event = build_event_name(event, suffix)
-  if callback is None:
-    _queue[event] = []
-  else:
-    for index, handler in enumerate(_queue[event]):
-      if callback == handler:
-        del _queue[event][index]
-
-  if (_queue[event]) == 0:
-    del _queue[event]
-
-  return True
+  return _bus.unregister(event=event, callback=callback, suffix=suffix)
 
 def unregister_all(event):
-  global _queue
-
-  target = build_event_name(event, '')
-  for event in list(_queue.keys()):
-    if event.find(target) == 0:
-      del _queue[event]
+  _bus.unregister_all(event)
 
 def trigger(event, *args, suffix=GLOBAL, **kwargs):
-  global _queue
-
-  if is_queued(event, suffix) is False:
-    return False
-  event = build_event_name(event, suffix)
-  for callback in _queue[event]:
-    safe_invoke_callback(callback, *args, **kwargs)
-  return True
+  return _bus.trigger(event, *args, suffix=suffix, **kwargs)
 
 def is_queued(event, suffix=GLOBAL):
-  global _queue
-
-  event = build_event_name(event, suffix)
-  return event in _queue and len(_queue[event]) > 0
+  return _bus.is_queued(event, suffix)
 
 def queue_size(event, suffix=GLOBAL):
-  global _queue
-
-  if is_queued(event, suffix) is False:
-    return 0
-  event = build_event_name(event, suffix)
-  return len(_queue[event])
+  return _bus.queue_size(event, suffix)
 
 def clear():
-  global _queue
-
-  _queue = {}
+  _bus.clear()
 
-def build_event_name(event, suffix):
-  return "{0}|{1}".format(event.strip(), suffix.strip())
+def handler_stats(top=10):
+  return _bus.handler_stats(top)
@@ -7,7 +7,7 @@ class Connect(Message):
   MINOR = 3
   REVISION = 0
 
-  def __init__(self, project, token):
+  def __init__(self, project, token, sessionid=None):
     self.method = 'blade.connect'
     params = {
       'version': {
@@ -21,4 +21,6 @@ class Connect(Message):
       },
       'agent': f'Python SDK/{__version__}'
     }
+    if sessionid is not None:
+      params['sessionid'] = sessionid
     super().__init__(params=params)
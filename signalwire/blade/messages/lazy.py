@@ -0,0 +1,43 @@
+import re
+from signalwire.blade.codec import get_codec
+from signalwire.blade.messages.message import Message
+
+_OPEN = re.compile(r'\s*\{')
+# leading string members of the envelope, without escape sequences
+_MEMBER = re.compile(r'\s*"(jsonrpc|id|method)"\s*:\s*"([^"\\]*)"\s*,?')
+_FIELDS = ('jsonrpc', 'id', 'method', 'params', 'error', 'result')
+
+# Inbound message decoded on demand: `id` and `method` are read from the head
+# of the frame (Blade sends them first), any other attribute decodes the whole
+# frame the first time it is accessed.
+class LazyMessage(Message):
+  def __init__(self, data, codec=None):
+    self._data = data
+    self._codec = codec
+    if isinstance(data, str):
+      self._scan(data)
+
+  def __getattr__(self, name):
+    if name.startswith('_') or self._data is None:
+      raise AttributeError(name)
+    self._materialize()
+    return object.__getattribute__(self, name)
+
+  def _scan(self, data):
+    match = _OPEN.match(data)
+    while match is not None:
+      if match.lastindex:
+        self.__dict__.setdefault(match.group(1), match.group(2))
+      match = _MEMBER.match(data, match.end())
+
+  def _materialize(self):
+    payload = get_codec(self._codec).loads(self._data)
+    self._data = None
+    for field in _FIELDS:
+      if field in payload:
+        self.__dict__.setdefault(field, payload[field])
+
+  def _payload(self):
+    if self._data is not None:
+      self._materialize()
+    return { k: v for k, v in self.__dict__.items() if not k.startswith('_') }
@@ -1,10 +1,11 @@
 import json
 from uuid import uuid4
+from signalwire.blade.codec import get_codec
 
 class Message:
   def __init__(self, **kwargs):
     self.jsonrpc = '2.0'
-    self.id = kwargs.pop('id', str(uuid4()))
+    self.id = kwargs.pop('id') if 'id' in kwargs else str(uuid4())
     if 'method' in kwargs:
       self.method = kwargs.pop('method')
     if 'params' in kwargs:
@@ -14,10 +15,18 @@ class Message:
     if 'result' in kwargs:
       self.result = kwargs.pop('result')
 
-  def to_json(self, **kwargs):
-    return json.dumps(self.__dict__, separators=(',', ':'), **kwargs)
+  def to_json(self, codec=None, **kwargs):
+    if kwargs:
+      return json.dumps(self._payload(), separators=(',', ':'), **kwargs)
+    return get_codec(codec).dumps(self._payload())
+
+  def to_bytes(self, codec=None):
+    return get_codec(codec).dumps_bytes(self._payload())
+
+  def _payload(self):
+    return self.__dict__
 
   @classmethod
-  def from_json(cls, json_str):
-    json_dict = json.loads(json_str)
+  def from_json(cls, json_str, codec=None):
+    json_dict = get_codec(codec).loads(json_str)
     return cls(**json_dict)
@@ -0,0 +1,32 @@
+import logging
+import random
+import time
+from collections import deque
+
+class WireLog:
+  def __init__(self, sample_rate=1.0, buffer_size=100):
+    self.sample_rate = sample_rate
+    self.frames = deque(maxlen=buffer_size)
+
+  def sent(self, data):
+    self._record('SEND', data)
+
+  def received(self, data):
+    self._record('RECV', data)
+
+  def dump(self, level=logging.ERROR):
+    logging.log(level, f'Last {len(self.frames)} frames:')
+    for timestamp, direction, data in self.frames:
+      logging.log(level, '%.6f %s: %s', timestamp, direction, _text(data))
+
+  def _record(self, direction, data):
+    # keep a reference only: the frame is already serialized
+    self.frames.append((time.time(), direction, data))
+    if not logging.root.isEnabledFor(logging.DEBUG):
+      return
+    if self.sample_rate < 1 and random.random() >= self.sample_rate:
+      return
+    logging.debug('%s: \n%s', direction, _text(data))
+
+def _text(data):
+  return data.decode('utf-8') if isinstance(data, bytes) else data
@@ -1,6 +1,5 @@
 from abc import ABC, abstractmethod, abstractproperty
 import logging
-from signalwire.blade.handler import register
 from .helpers import receive_contexts
 
 class BaseRelay(ABC):
@@ -25,7 +24,7 @@ class BaseRelay(ABC):
     try:
       await receive_contexts(self.client, contexts)
       for context in contexts:
-        register(event=self.client.protocol, callback=handler, suffix=self.ctx_receive_unique(context))
+        self._register(handler, self.ctx_receive_unique(context))
     except Exception as error:
       logging.error('receive error: {0}'.format(str(error)))
 
@@ -33,6 +32,11 @@ class BaseRelay(ABC):
     try:
       await receive_contexts(self.client, contexts)
       for context in contexts:
-        register(event=self.client.protocol, callback=handler, suffix=self.ctx_state_unique(context))
+        self._register(handler, self.ctx_state_unique(context))
     except Exception as error:
       logging.error('state_change error: {0}'.format(str(error)))
+
+  def _register(self, handler, suffix):
+    # receive() runs again on every ready event: keep one registration per handler
+    self.client.bus.unregister(event=self.client.protocol, callback=handler, suffix=suffix)
+    self.client.bus.register(event=self.client.protocol, callback=handler, suffix=suffix)
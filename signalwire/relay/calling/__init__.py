@@ -1,40 +1,43 @@
 import logging
-from signalwire.blade.handler import trigger
+import time
 from signalwire.relay import BaseRelay
 from .call import Call
-from .constants import Notification, DetectState, ConnectState
+from .registry import CallRegistry
+from .constants import Notification, CallState, DetectState, ConnectState
 
 class Calling(BaseRelay):
+  CALL_IDLE_TTL = None # seconds without events before a call is evicted, None to disable
+  SWEEP_INTERVAL = 60
+
   def __init__(self, client):
     super().__init__(client)
-    self.calls = []
+    self.calls = CallRegistry()
+    self.evicted_calls = 0
+    self._sweeper = None
+    self._handlers = {
+      Notification.STATE: self._on_state,
+      Notification.RECEIVE: self._on_receive,
+      Notification.CONNECT: self._on_connect,
+      Notification.PLAY: self._on_play,
+      Notification.COLLECT: self._on_collect,
+      Notification.RECORD: self._on_record,
+      Notification.FAX: self._on_fax,
+      Notification.SEND_DIGITS: self._on_send_digits,
+      Notification.TAP: self._on_tap,
+      Notification.DETECT: self._on_detect
+    }
 
   @property
   def service(self):
     return 'calling'
 
   def notification_handler(self, notification):
-    notification['params']['event_type'] = notification['event_type']
-    if notification['event_type'] == Notification.STATE:
-      self._on_state(notification['params'])
-    elif notification['event_type'] == Notification.RECEIVE:
-      self._on_receive(notification['params'])
-    elif notification['event_type'] == Notification.CONNECT:
-      self._on_connect(notification['params'])
-    elif notification['event_type'] == Notification.PLAY:
-      self._on_play(notification['params'])
-    elif notification['event_type'] == Notification.COLLECT:
-      self._on_collect(notification['params'])
-    elif notification['event_type'] == Notification.RECORD:
-      self._on_record(notification['params'])
-    elif notification['event_type'] == Notification.FAX:
-      self._on_fax(notification['params'])
-    elif notification['event_type'] == Notification.SEND_DIGITS:
-      self._on_send_digits(notification['params'])
-    elif notification['event_type'] == Notification.TAP:
-      self._on_tap(notification['params'])
-    elif notification['event_type'] == Notification.DETECT:
-      self._on_detect(notification['params'])
+    event_type = notification['event_type']
+    params = notification['params']
+    params['event_type'] = event_type
+    handler = self._handlers.get(event_type, None)
+    if handler is not None:
+      handler(params)
 
   def new_call(self, *, call_type='phone', from_number, to_number, timeout=None):
     call = Call(calling=self)
@@ -53,113 +56,138 @@ class Calling(BaseRelay):
     return await call.dial()
 
   def add_call(self, call):
-    self.calls.append(call)
+    self.calls.add(call)
+    self._schedule_sweep()
 
   def remove_call(self, call):
-    try:
-      self.calls.remove(call)
-    except ValueError:
+    if not self.calls.remove(call):
       logging.warn('Call to remove not found')
 
+  def call_stats(self):
+    return {
+      'live': len(self.calls),
+      'evicted': self.evicted_calls
+    }
+
+  def _schedule_sweep(self):
+    if self.CALL_IDLE_TTL is not None and self._sweeper is None:
+      self._sweeper = self.client.loop.call_later(self.SWEEP_INTERVAL, self._sweep)
+
+  def _sweep(self):
+    self._sweeper = None
+    for call in self.calls.idle_since(time.monotonic() - self.CALL_IDLE_TTL):
+      self._evict(call)
+    if len(self.calls) > 0:
+      self._schedule_sweep()
+
+  def _evict(self, call):
+    logging.warning(f'Evicting call {call.id or call.tag}: no events for {self.CALL_IDLE_TTL}s')
+    self.evicted_calls += 1
+    # synthetic end: terminates pending components and releases the call handlers
+    call._state_changed({
+      'call_id': call.id,
+      'node_id': call.node_id,
+      'tag': call.tag,
+      'call_state': CallState.ENDED
+    })
+
+  def _route(self, call_id):
+    route = self.calls.route(call_id)
+    if route is not None:
+      self.calls.touch(route.call)
+    return route
+
   def _get_call_by_id(self, call_id):
-    for call in self.calls:
-      if call.id == call_id:
-        return call
-    return None
+    return self.calls.get_by_id(call_id)
 
   def _get_call_by_tag(self, tag):
-    for call in self.calls:
-      if call.tag == tag:
-        return call
-    return None
+    return self.calls.get_by_tag(tag)
 
   def _on_state(self, params):
-    call = self._get_call_by_id(params['call_id'])
+    route = self._route(params['call_id'])
     tag = params.get('tag', None)
-    if call is None and tag is not None:
-      call = self._get_call_by_tag(tag)
-
-    if call is not None:
-      if call.id is None:
-        call.id = params['call_id']
-        call.node_id = params['node_id']
-      trigger(Notification.STATE, params, suffix=call.tag) # Notify components listening on State and Tag
-      call._state_changed(params)
+    if route is None and tag is not None:
+      call = self.calls.get_by_tag(tag)
+      if call is not None:
+        if call.id is None:
+          call.id = params['call_id']
+          call.node_id = params['node_id']
+        route = self.calls.index_id(call) # dialed call learns its call_id
+        self.calls.touch(call)
+
+    if route is not None:
+      route.notify(Notification.STATE, route.tag, params) # Notify components listening on State and Tag
+      route.call._state_changed(params)
     elif 'call_id' in params and 'peer' in params:
-      call = Call(calling=self, **params)
+      Call(calling=self, **params)
     else:
       logging.error('Unknown call {0}'.format(params['call_id']))
 
   def _on_receive(self, params):
     call = Call(calling=self, **params)
-    trigger(self.client.protocol, call, suffix=self.ctx_receive_unique(call.context))
+    self.client.bus.trigger(self.client.protocol, call, suffix=self.ctx_receive_unique(call.context))
 
   def _on_connect(self, params):
-    call = self._get_call_by_id(params['call_id'])
+    route = self._route(params['call_id'])
     state = params['connect_state']
-    if call is not None:
+    if route is not None:
       try:
         if state == ConnectState.CONNECTED:
-          call.peer = self._get_call_by_id(params['peer']['call_id'])
+          route.call.peer = self._get_call_by_id(params['peer']['call_id'])
         else:
-          call.peer = None
+          route.call.peer = None
       except KeyError:
         pass
-      trigger(Notification.CONNECT, params, suffix=call.tag) # Notify components listening on Connect and Tag
-      trigger(call.tag, params, suffix='connect.stateChange')
-      trigger(call.tag, params, suffix=f"connect.{state}")
+      route.notify(Notification.CONNECT, route.tag, params) # Notify components listening on Connect and Tag
+      route.emit(params, 'connect.stateChange', f"connect.{state}")
 
   def _on_play(self, params):
-    call = self._get_call_by_id(params['call_id'])
-    if call is not None:
-      trigger(Notification.PLAY, params, suffix=params['control_id']) # Notify components listening on Play and control_id
-      trigger(call.tag, params, suffix='play.stateChange')
-      trigger(call.tag, params, suffix=f"play.{params['state']}")
+    route = self._route(params['call_id'])
+    if route is not None:
+      route.notify(Notification.PLAY, params['control_id'], params) # Notify components listening on Play and control_id
+      route.emit(params, 'play.stateChange', f"play.{params['state']}")
 
   def _on_collect(self, params):
-    call = self._get_call_by_id(params['call_id'])
-    if call is not None:
-      trigger(Notification.COLLECT, params, suffix=params['control_id']) # Notify components listening on Collect and control_id
-      trigger(call.tag, params, suffix='prompt')
+    route = self._route(params['call_id'])
+    if route is not None:
+      route.notify(Notification.COLLECT, params['control_id'], params) # Notify components listening on Collect and control_id
+      route.emit(params, 'prompt')
 
   def _on_record(self, params):
-    call = self._get_call_by_id(params['call_id'])
-    if call is not None:
-      trigger(Notification.RECORD, params, suffix=params['control_id']) # Notify components listening on Record and control_id
-      trigger(call.tag, params, suffix='record.stateChange')
-      trigger(call.tag, params, suffix=f"record.{params['state']}")
+    route = self._route(params['call_id'])
+    if route is not None:
+      route.notify(Notification.RECORD, params['control_id'], params) # Notify components listening on Record and control_id
+      route.emit(params, 'record.stateChange', f"record.{params['state']}")
 
   def _on_fax(self, params):
-    call = self._get_call_by_id(params['call_id'])
-    if call is not None:
-      trigger(Notification.FAX, params, suffix=params['control_id']) # Notify components listening on Fax and control_id
-      trigger(call.tag, params, suffix='fax.stateChange')
+    route = self._route(params['call_id'])
+    if route is not None:
+      route.notify(Notification.FAX, params['control_id'], params) # Notify components listening on Fax and control_id
+      route.emit(params, 'fax.stateChange')
       try:
-        trigger(call.tag, params, suffix=f"fax.{params['fax']['type']}")
+        route.emit(params, f"fax.{params['fax']['type']}")
       except KeyError:
         pass
 
   def _on_send_digits(self, params):
-    call = self._get_call_by_id(params['call_id'])
-    if call is not None:
-      trigger(Notification.SEND_DIGITS, params, suffix=params['control_id']) # Notify components listening on SendDigits and control_id
-      trigger(call.tag, params, suffix='sendDigits.stateChange')
-      trigger(call.tag, params, suffix=f"sendDigits.{params['state']}")
+    route = self._route(params['call_id'])
+    if route is not None:
+      route.notify(Notification.SEND_DIGITS, params['control_id'], params) # Notify components listening on SendDigits and control_id
+      route.emit(params, 'sendDigits.stateChange', f"sendDigits.{params['state']}")
 
   def _on_tap(self, params):
-    call = self._get_call_by_id(params['call_id'])
-    if call is not None:
-      trigger(Notification.TAP, params, suffix=params['control_id']) # Notify components listening on Tap and control_id
-      trigger(call.tag, params, suffix='tap.stateChange')
-      trigger(call.tag, params, suffix=f"tap.{params['state']}")
+    route = self._route(params['call_id'])
+    if route is not None:
+      route.notify(Notification.TAP, params['control_id'], params) # Notify components listening on Tap and control_id
+      route.emit(params, 'tap.stateChange', f"tap.{params['state']}")
 
   def _on_detect(self, params):
-    call = self._get_call_by_id(params['call_id'])
-    if call is not None:
-      trigger(Notification.DETECT, params, suffix=params['control_id']) # Notify components listening on Detect and control_id
+    route = self._route(params['call_id'])
+    if route is not None:
+      route.notify(Notification.DETECT, params['control_id'], params) # Notify components listening on Detect and control_id
       try:
         event = params['detect']['params']['event']
         suffix = event if event == DetectState.FINISHED or event == DetectState.ERROR else 'update'
-        trigger(call.tag, params['detect'], suffix=f"detect.{suffix}")
+        route.emit(params['detect'], f"detect.{suffix}")
       except KeyError:
         pass
@@ -2,6 +2,7 @@ from . import BaseAction
 from ..results.connect_result import ConnectResult
 
 class ConnectAction(BaseAction):
+  __slots__ = ()
 
   @property
   def result(self):
@@ -3,6 +3,7 @@ from ..results.detect_result import DetectResult
 from ..results.stop_result import StopResult
 
 class DetectAction(BaseAction):
+  __slots__ = ()
 
   @property
   def result(self):
@@ -3,6 +3,7 @@ from ..results.fax_result import FaxResult
 from ..results.stop_result import StopResult
 
 class FaxAction(BaseAction):
+  __slots__ = ()
 
   @property
   def result(self):
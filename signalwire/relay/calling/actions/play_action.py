@@ -3,6 +3,7 @@ from ..results.play_result import PlayResult, PlayPauseResult, PlayResumeResult,
 from ..results.stop_result import StopResult
 
 class PlayAction(BaseAction):
+  __slots__ = ()
 
   @property
   def result(self):
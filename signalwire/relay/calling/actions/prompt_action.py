@@ -3,6 +3,7 @@ from ..results.prompt_result import PromptResult, PromptVolumeResult
 from ..results.stop_result import StopResult
 
 class PromptAction(BaseAction):
+  __slots__ = ()
 
   @property
   def result(self):
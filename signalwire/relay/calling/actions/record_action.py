@@ -3,6 +3,7 @@ from ..results.record_result import RecordResult
 from ..results.stop_result import StopResult
 
 class RecordAction(BaseAction):
+  __slots__ = ()
 
   @property
   def result(self):
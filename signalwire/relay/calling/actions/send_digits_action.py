@@ -2,6 +2,7 @@ from . import BaseAction
 from ..results.send_digits_result import SendDigitsResult
 
 class SendDigitsAction(BaseAction):
+  __slots__ = ()
 
   @property
   def result(self):
@@ -3,6 +3,7 @@ from ..results.tap_result import TapResult
 from ..results.stop_result import StopResult
 
 class TapAction(BaseAction):
+  __slots__ = ()
 
   @property
   def result(self):
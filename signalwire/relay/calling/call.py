@@ -1,5 +1,4 @@
 from uuid import uuid4
-from signalwire.blade.handler import trigger, register, unregister, unregister_all
 from .constants import CallState, DisconnectReason, ConnectState, CallPlayState, MediaType, RecordType, TapType, CallTapState, CallFaxState, CallSendDigitsState, DetectState, DetectType, PromptState
 from .helpers import prepare_prompt_media_list
 from .components.dial import Dial
@@ -38,6 +37,8 @@ from .components.disconnect import Disconnect
 from .results.disconnect_result import DisconnectResult
 
 class Call:
+  __slots__ = ('calling', 'tag', 'id', 'node_id', 'context', 'call_type', 'from_number', 'to_number', 'timeout', 'prev_state', 'state', 'peer', 'failed', 'busy')
+
   def __init__(self, *, calling, **kwargs):
     self.calling = calling
     self.tag = str(uuid4())
@@ -82,11 +83,11 @@ class Call:
     return self.state == CallState.ENDING or self.state == CallState.ENDED
 
   def on(self, event, callback):
-    register(event=self.tag, callback=callback, suffix=event)
+    self.calling.client.bus.register(event=self.tag, callback=callback, suffix=event)
     return self
 
   def off(self, event, callback=None):
-    unregister(event=self.tag, callback=callback, suffix=event)
+    self.calling.client.bus.unregister(event=self.tag, callback=callback, suffix=event)
     return self
 
   async def dial(self):
@@ -319,12 +320,13 @@ class Call:
   def _state_changed(self, params):
     self.prev_state = self.state
     self.state = params['call_state']
-    trigger(self.tag, params, suffix='stateChange')
-    trigger(self.tag, params, suffix=self.state)
+    bus = self.calling.client.bus
+    bus.trigger(self.tag, params, suffix='stateChange')
+    bus.trigger(self.tag, params, suffix=self.state)
     if self.state == CallState.ENDED:
       check_id = self.id if self.id else self.tag
-      trigger(check_id, params, suffix=CallState.ENDED) # terminate components
-      unregister_all(self.tag) # unregister all external handlers
+      bus.trigger(check_id, params, suffix=CallState.ENDED) # terminate components
+      bus.unregister_all(self.tag) # unregister all external handlers
       end_reason = params.get('end_reason', '')
       self.failed = end_reason == DisconnectReason.ERROR
       self.busy = end_reason == DisconnectReason.BUSY
@@ -2,12 +2,13 @@ import asyncio
 import logging
 from abc import ABC, abstractmethod, abstractproperty
 from uuid import uuid4
-from signalwire.blade.handler import register, unregister
 from signalwire.blade.messages.execute import Execute
 from ..constants import CallState
 from ...event import Event
 
 class BaseComponent(ABC):
+  __slots__ = ('call', 'control_id', 'state', 'completed', 'successful', 'event', '_future', '_execute_result', '_events_to_await', '__weakref__')
+
   def __init__(self, call):
     self.call = call
     self.control_id = str(uuid4())
@@ -36,15 +37,20 @@ class BaseComponent(ABC):
     pass
 
   def register(self):
-    register(event=self.event_type, callback=self.notification_handler, suffix=self.control_id)
+    bus = self.call.calling.client.bus
+    # Without a pending wait_for() nothing awaits this component: hold it weakly so
+    # dropped *_async actions release their handlers.
+    weak = not self.has_future()
+    bus.register(event=self.event_type, callback=self.notification_handler, suffix=self.control_id, weak=weak)
     check_id = self.call.id if self.call.id else self.call.tag
-    register(event=check_id, callback=self.terminate, suffix=CallState.ENDED)
+    bus.register(event=check_id, callback=self.terminate, suffix=CallState.ENDED, weak=weak)
 
   def unregister(self):
-    unregister(event=self.event_type, callback=self.notification_handler, suffix=self.control_id)
+    bus = self.call.calling.client.bus
+    bus.unregister(event=self.event_type, callback=self.notification_handler, suffix=self.control_id)
     if self.call.id:
-      unregister(event=self.call.id, callback=self.terminate, suffix=CallState.ENDED)
-    unregister(event=self.call.tag, callback=self.terminate, suffix=CallState.ENDED)
+      bus.unregister(event=self.call.id, callback=self.terminate, suffix=CallState.ENDED)
+    bus.unregister(event=self.call.tag, callback=self.terminate, suffix=CallState.ENDED)
 
   async def execute(self):
     if self.call.ended == True:
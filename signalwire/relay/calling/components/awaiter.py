@@ -3,6 +3,7 @@ from ..constants import Notification, CallState
 from ...event import Event
 
 class Awaiter(BaseComponent):
+  __slots__ = ()
 
   def __init__(self, call):
     super().__init__(call)
@@ -5,6 +5,7 @@ from .decorators import stoppable
 
 @stoppable
 class BaseFax(BaseComponent):
+  __slots__ = ('direction', 'identity', 'remote_identity', 'document', 'pages')
 
   def __init__(self, call):
     super().__init__(call)
@@ -4,6 +4,8 @@ from ..constants import Method, Notification, ConnectState
 from ...event import Event
 
 class Connect(BaseComponent):
+  __slots__ = ('devices', 'ringback')
+
   def __init__(self, call, devices, ringback=[]):
     super().__init__(call)
     self.control_id = call.tag
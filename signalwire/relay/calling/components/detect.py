@@ -5,6 +5,7 @@ from .decorators import stoppable
 
 @stoppable
 class Detect(BaseComponent):
+  __slots__ = ('detect_type', 'detect', 'timeout', 'result', '_wait_for_beep', '_waiting_for_ready', '_results')
 
   def __init__(self, call, detect_type, wait_for_beep=False, timeout=None, initial_timeout=None, end_silence_timeout=None, machine_voice_threshold=None, machine_words_threshold=None, tone=None, digits=None):
     super().__init__(call)
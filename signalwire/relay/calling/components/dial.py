@@ -3,6 +3,8 @@ from ..constants import Method, Notification, CallState
 from ...event import Event
 
 class Dial(BaseComponent):
+  __slots__ = ()
+
   def __init__(self, call):
     super().__init__(call)
     self.control_id = call.tag
@@ -3,6 +3,8 @@ from ..constants import Method, Notification, ConnectState
 from ...event import Event
 
 class Disconnect(BaseComponent):
+  __slots__ = ()
+
   def __init__(self, call):
     super().__init__(call)
     self.control_id = call.tag
@@ -2,6 +2,7 @@ from .base_fax import BaseFax
 from ..constants import Method
 
 class FaxReceive(BaseFax):
+  __slots__ = ()
 
   @property
   def method(self):
@@ -2,6 +2,7 @@ from .base_fax import BaseFax
 from ..constants import Method
 
 class FaxSend(BaseFax):
+  __slots__ = ('_document', '_identity', '_header')
 
   def __init__(self, call, document, identity=None, header=None):
     super().__init__(call)
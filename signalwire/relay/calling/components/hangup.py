@@ -3,6 +3,8 @@ from ..constants import Method, Notification, CallState
 from ...event import Event
 
 class Hangup(BaseComponent):
+  __slots__ = ('reason',)
+
   def __init__(self, call, reason: str):
     super().__init__(call)
     self.control_id = call.tag
@@ -9,6 +9,7 @@ from .decorators import stoppable, pausable, resumable, has_volume_control
 @resumable
 @has_volume_control
 class Play(BaseComponent):
+  __slots__ = ('play', 'volume_value')
 
   def __init__(self, call, play, volume=0):
     super().__init__(call)
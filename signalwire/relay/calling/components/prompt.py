@@ -7,6 +7,7 @@ from .decorators import stoppable, has_volume_control
 @stoppable
 @has_volume_control
 class Prompt(BaseComponent):
+  __slots__ = ('play', 'volume_value', 'prompt_type', 'confidence', 'input', 'terminator', '_collect')
 
   def __init__(self, call, prompt_type, play, **kwargs):
     super().__init__(call)
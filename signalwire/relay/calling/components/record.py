@@ -6,6 +6,7 @@ from .decorators import stoppable
 
 @stoppable
 class Record(BaseComponent):
+  __slots__ = ('url', 'duration', 'size', '_record')
 
   def __init__(self, call, record_type=RecordType.AUDIO, beep=None, record_format=None, stereo=None, direction=None, initial_timeout=None, end_silence_timeout=None, terminators=None):
     super().__init__(call)
@@ -3,6 +3,7 @@ from ..constants import Method, Notification, CallSendDigitsState
 from ...event import Event
 
 class SendDigits(BaseComponent):
+  __slots__ = ('digits',)
 
   def __init__(self, call, digits):
     super().__init__(call)
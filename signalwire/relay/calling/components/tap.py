@@ -5,6 +5,7 @@ from .decorators import stoppable
 
 @stoppable
 class Tap(BaseComponent):
+  __slots__ = ('tap', 'device')
 
   def __init__(self, call, audio_direction, target_type, target_addr=None, target_port=None, target_ptime=None, target_uri=None, rate=None, codec=None):
     super().__init__(call)
@@ -0,0 +1,63 @@
+import time
+from collections import OrderedDict
+from .route import CallRoute
+
+class CallRegistry:
+  def __init__(self):
+    self._by_tag = {}
+    self._by_id = {} # call_id -> CallRoute
+    self._last_seen = OrderedDict() # tag -> monotonic time, least recently seen first
+
+  def __iter__(self):
+    return iter(list(self._by_tag.values()))
+
+  def __len__(self):
+    return len(self._by_tag)
+
+  def __contains__(self, call):
+    return self._by_tag.get(call.tag, None) is call
+
+  def add(self, call):
+    self._by_tag[call.tag] = call
+    self._last_seen[call.tag] = time.monotonic()
+    if call.id is not None:
+      self.index_id(call)
+
+  def index_id(self, call):
+    route = self._by_id.get(call.id, None)
+    if route is None or route.call is not call:
+      route = self._by_id[call.id] = CallRoute(call)
+    return route
+
+  def remove(self, call):
+    if self._by_tag.get(call.tag, None) is not call:
+      return False
+    del self._by_tag[call.tag]
+    self._last_seen.pop(call.tag, None)
+    route = self._by_id.get(call.id, None)
+    if route is not None and route.call is call:
+      del self._by_id[call.id]
+    return True
+
+  def touch(self, call):
+    if call.tag in self._last_seen:
+      self._last_seen[call.tag] = time.monotonic()
+      self._last_seen.move_to_end(call.tag)
+
+  def idle_since(self, deadline):
+    idle = []
+    for tag, last_seen in self._last_seen.items():
+      if last_seen > deadline:
+        break
+      idle.append(self._by_tag[tag])
+    return idle
+
+  def route(self, call_id):
+    return self._by_id.get(call_id, None)
+
+  def get_by_id(self, call_id):
+    route = self._by_id.get(call_id, None)
+    return route.call if route is not None else None
+
+  def get_by_tag(self, tag):
+    return self._by_tag.get(tag, None)
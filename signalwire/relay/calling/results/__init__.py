@@ -2,6 +2,8 @@ from abc import ABC
 from ..components import BaseComponent
 
 class BaseResult(ABC):
+  __slots__ = ('component',)
+
   def __init__(self, component: BaseComponent):
     self.component = component
 
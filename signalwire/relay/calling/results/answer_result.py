@@ -1,5 +1,7 @@
 from . import BaseResult
 
 class AnswerResult(BaseResult):
+  __slots__ = ()
+
   def __init__(self, component):
     super().__init__(component)
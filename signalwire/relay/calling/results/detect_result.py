@@ -1,6 +1,7 @@
 from . import BaseResult
 
 class DetectResult(BaseResult):
+  __slots__ = ()
 
   @property
   def detect_type(self):
@@ -1,5 +1,7 @@
 from . import BaseResult
 
 class DisconnectResult(BaseResult):
+  __slots__ = ()
+
   def __init__(self, component):
     super().__init__(component)
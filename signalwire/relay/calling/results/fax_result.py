@@ -1,6 +1,7 @@
 from . import BaseResult
 
 class FaxResult(BaseResult):
+  __slots__ = ()
 
   @property
   def direction(self):
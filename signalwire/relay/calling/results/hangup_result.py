@@ -1,6 +1,8 @@
 from . import BaseResult
 
 class HangupResult(BaseResult):
+  __slots__ = ()
+
   def __init__(self, component):
     super().__init__(component)
 
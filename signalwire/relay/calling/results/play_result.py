@@ -1,16 +1,22 @@
 from . import BaseResult
 
 class PlayResult(BaseResult):
-  pass
+  __slots__ = ()
 
 class PlayPauseResult:
+  __slots__ = ('successful',)
+
   def __init__(self, successful):
     self.successful = successful
 
 class PlayResumeResult:
+  __slots__ = ('successful',)
+
   def __init__(self, successful):
     self.successful = successful
 
 class PlayVolumeResult:
+  __slots__ = ('successful',)
+
   def __init__(self, successful):
     self.successful = successful
@@ -1,6 +1,7 @@
 from . import BaseResult
 
 class PromptResult(BaseResult):
+  __slots__ = ()
 
   @property
   def prompt_type(self):
@@ -19,5 +20,7 @@ class PromptResult(BaseResult):
     return self.component.confidence
 
 class PromptVolumeResult:
+  __slots__ = ('successful',)
+
   def __init__(self, successful):
     self.successful = successful
@@ -1,6 +1,7 @@
 from . import BaseResult
 
 class RecordResult(BaseResult):
+  __slots__ = ()
 
   @property
   def url(self):
@@ -1,4 +1,4 @@
 from . import BaseResult
 
 class SendDigitsResult(BaseResult):
-  pass
+  __slots__ = ()
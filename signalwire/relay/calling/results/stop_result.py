@@ -1,3 +1,5 @@
 class StopResult:
+  __slots__ = ('successful',)
+
   def __init__(self, successful):
     self.successful = successful
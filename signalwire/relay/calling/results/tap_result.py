@@ -1,6 +1,7 @@
 from . import BaseResult
 
 class TapResult(BaseResult):
+  __slots__ = ()
 
   @property
   def tap(self):
@@ -0,0 +1,16 @@
+class CallRoute:
+  def __init__(self, call):
+    self.call = call
+    self.tag = call.tag
+    self.bus = call.calling.client.bus
+
+  def notify(self, event_type, control_id, params):
+    return self.bus.trigger(event_type, params, suffix=control_id)
+
+  def emit(self, params, *suffixes):
+    # most calls have no listeners attached with Call.on(): skip building their keys
+    if not self.bus.has_listeners(self.tag):
+      return False
+    for suffix in suffixes:
+      self.bus.trigger(self.tag, params, suffix=suffix)
+    return True
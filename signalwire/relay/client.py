@@ -4,29 +4,42 @@ import logging
 import signal
 import aiohttp
 from uuid import uuid4
+from contextvars import ContextVar
 from signalwire.blade.connection import Connection
 from signalwire.blade.messages.connect import Connect
 from signalwire.blade.messages.ping import Ping
-from signalwire.blade.handler import register, unregister, trigger
+from signalwire.blade.handler import EventBus
+from signalwire.blade.codec import get_codec
 from .helpers import setup_protocol
 from .calling import Calling
 from .tasking import Tasking
 from .messaging import Messaging
 from .message_handler import handle_inbound_message
 from .constants import Constants, WebSocketEvents
+from .exceptions import RequestTimeout, ConnectionLost
+from .pipeline import RequestPipeline
+from .timer import TimerWheel
+from .reconnect import ReconnectPolicy
+
+_handshake = ContextVar('handshake', default=False)
 
 class Client:
   PING_DELAY = 10
+  REQUEST_TIMEOUT = 30 # seconds, None to wait forever
 
-  def __init__(self, project, token, host=Constants.HOST, connection=Connection):
+  def __init__(self, project, token, host=Constants.HOST, connection=Connection, codec=None, reconnect_policy=None):
     self.loop = asyncio.get_event_loop()
     self.host = host
     self.project = project
     self.token = token
+    self.bus = EventBus()
+    self.codec = get_codec(codec)
     self.attach_signals()
     self.connection = connection(self)
     self.uuid = str(uuid4())
     self._reconnect = True
+    self.reconnect_policy = reconnect_policy or ReconnectPolicy()
+    self.reconnect_policy.on_state_change = self._circuit_changed
     self.session_id = None
     self.signature = None
     self.protocol = None
@@ -35,8 +48,11 @@ class Client:
     self._tasking = None
     self._messaging = None
     self._requests = {}
+    self._timeouts = TimerWheel(self._request_timed_out)
     self._idle = False
-    self._executeQueue = asyncio.Queue()
+    self._opening = False # connect and protocol setup in progress: requests wait in the queue
+    self._pipeline = RequestPipeline()
+    self._executeQueue = self._pipeline.queue
     self._pingInterval = None
     log_level = os.getenv('LOG_LEVEL', 'INFO').upper()
     logging.basicConfig(level=log_level)
@@ -63,52 +79,82 @@ class Client:
       self._messaging = Messaging(self)
     return self._messaging
 
-  async def execute(self, message):
+  async def execute(self, message, timeout=None):
     if message.id not in self._requests:
       self._requests[message.id] = self.loop.create_future()
+    future = self._requests[message.id]
+    timeout = self.REQUEST_TIMEOUT if timeout is None else timeout
+    if timeout:
+      self._timeouts.add(message.id, timeout)
+
+    try:
+      if _handshake.get() or (self._idle == False and self._opening == False and self.connected == True):
+        await self._send(message)
+      else:
+        self._pipeline.enqueue(message)
+      return await future
+    finally:
+      self._requests.pop(message.id, None)
+      self._timeouts.discard(message.id)
+      self._pipeline.done(message.id)
 
-    if self._idle == True or self.connected == False:
-      await self._executeQueue.put(message)
-    else:
-      await self.connection.send(message)
-    result = await self._requests[message.id]
-    del self._requests[message.id]
-    return result
+  async def _send(self, message):
+    self._pipeline.sent(message)
+    await self.connection.send(message)
+
+  def _request_timed_out(self, uuid):
+    future = self._requests.pop(uuid, None)
+    if future is not None and not future.done():
+      future.set_exception(RequestTimeout(f'Request {uuid} timed out'))
 
   def connect(self):
     while self._reconnect:
       self.loop.run_until_complete(self._connect())
 
   async def _connect(self):
+    self.reconnect_policy.attempt()
     try:
+      self._opening = True
       await self.connection.connect()
       asyncio.create_task(self.on_socket_open())
-      await self.connection.read()
-      self.on_socket_close()
+      try:
+        await self.connection.read()
+      finally:
+        self.on_socket_close()
     except aiohttp.client_exceptions.ClientConnectorError as error:
-      trigger(WebSocketEvents.ERROR, error, suffix=self.uuid)
+      self.bus.trigger(WebSocketEvents.ERROR, error, suffix=self.uuid)
       logging.warn(f"{self.host} seems down..")
+    except (aiohttp.ClientError, OSError) as error:
+      self.bus.trigger(WebSocketEvents.ERROR, error, suffix=self.uuid)
+      logging.error(f'Connection error: {error}')
+    delay = self.reconnect_policy.failure()
     try:
-      logging.info('Connection closed..')
-      await asyncio.sleep(5)
+      logging.info(f'Connection closed.. reconnecting in {delay:.1f}s')
+      if delay > 0:
+        await asyncio.sleep(delay)
     except asyncio.CancelledError:
       pass
 
+  def _circuit_changed(self, state):
+    logging.info(f'Reconnect circuit {state}')
+    self.bus.trigger(WebSocketEvents.CIRCUIT, state, suffix=self.uuid)
+
   async def disconnect(self):
     logging.info('Disconnection..')
     self._idle = True
     self._reconnect = False
     await self.connection.close()
     await self.cancel_pending_tasks()
+    self.bus.clear()
     logging.info(f"Bye bye!")
     self.loop.stop()
 
   def on(self, event, callback):
-    register(event=event, callback=callback, suffix=self.uuid)
+    self.bus.register(event=event, callback=callback, suffix=self.uuid)
     return self
 
   def off(self, event, callback=None):
-    unregister(event=event, callback=callback, suffix=self.uuid)
+    self.bus.unregister(event=event, callback=callback, suffix=self.uuid)
     return self
 
   async def cancel_pending_tasks(self):
@@ -130,22 +176,39 @@ class Client:
   def on_socket_close(self):
     if self._pingInterval:
       self._pingInterval.cancel()
-    self.contexts = []
-    trigger(WebSocketEvents.CLOSE, suffix=self.uuid)
+    for message in self._pipeline.recover():
+      future = self._requests.get(message.id, None)
+      if future is not None and not future.done():
+        future.set_exception(ConnectionLost(f'Connection closed before the response to {message.id}'))
+    self.bus.trigger(WebSocketEvents.CLOSE, suffix=self.uuid)
 
   async def on_socket_open(self):
+    handshake = _handshake.set(True) # connect and setup requests skip the queue
     try:
       self._idle = False
-      trigger(WebSocketEvents.OPEN, suffix=self.uuid)
-      result = await self.execute(Connect(project=self.project, token=self.token))
+      self.bus.trigger(WebSocketEvents.OPEN, suffix=self.uuid)
+      result = await self.execute(Connect(project=self.project, token=self.token, sessionid=self.session_id))
+      restored = result.get('session_restored', False) and self.protocol is not None
       self.session_id = result['sessionid']
       self.signature = result['authorization']['signature']
-      self.protocol = await setup_protocol(self)
+      if restored:
+        logging.info('Session restored')
+      else:
+        previous = self.protocol
+        if previous is not None:
+          self.bus.unregister_all(previous) # handlers bound to the previous session
+        self.contexts = []
+        self.protocol = await setup_protocol(self)
+        if previous is not None:
+          self._pipeline.rebind(previous, self.protocol)
       await self._clearExecuteQueue()
+      _handshake.reset(handshake)
+      self._opening = False
       self._pong = True
       self.keepalive()
+      self.reconnect_policy.success()
       logging.info('Client connected!')
-      trigger(Constants.READY, self, suffix=self.uuid)
+      self.bus.trigger(Constants.READY, self, suffix=self.uuid)
     except Exception as error:
       logging.error('Client setup error: {0}'.format(str(error)))
       await self.connection.close()
@@ -155,20 +218,25 @@ class Client:
       if self._pong is False:
         return await self.connection.close()
       self._pong = False
-      await self.execute(Ping())
-      self._pong = True
+      try:
+        await self.execute(Ping(), timeout=self.PING_DELAY)
+        self._pong = True
+      except RequestTimeout:
+        logging.warning('Ping timed out')
     asyncio.create_task(send_ping())
     self._pingInterval = self.loop.call_later(self.PING_DELAY, self.keepalive)
 
   async def _clearExecuteQueue(self):
-    while True:
-      if self._executeQueue.empty():
-        break
-      message = self._executeQueue.get_nowait()
-      asyncio.create_task(self.connection.send(message))
+    # one at a time and in order: a message taken from the queue is in-flight
+    # before it is written, so a drop during the flush recovers it
+    message = self._pipeline.dequeue()
+    while message is not None:
+      if message.id in self._requests:
+        await self._send(message)
+      message = self._pipeline.dequeue()
 
   def message_handler(self, msg):
-    trigger(WebSocketEvents.MESSAGE, msg, suffix=self.uuid)
+    self.bus.trigger(WebSocketEvents.MESSAGE, msg, suffix=self.uuid)
     if msg.id not in self._requests:
       return handle_inbound_message(self, msg)
 
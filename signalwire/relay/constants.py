@@ -7,6 +7,7 @@ class WebSocketEvents:
   CLOSE = 'signalwire.socket.close'
   MESSAGE = 'signalwire.socket.message'
   ERROR = 'signalwire.socket.error'
+  CIRCUIT = 'signalwire.socket.circuit'
 
 class BladeMethod:
   NETCAST = 'blade.netcast'
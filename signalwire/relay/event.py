@@ -1,4 +1,6 @@
 class Event:
+  __slots__ = ('name', 'payload')
+
   def __init__(self, name, payload):
     self.name = name
     self.payload = payload
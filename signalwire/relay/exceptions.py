@@ -0,0 +1,8 @@
+class RelayError(Exception):
+  pass
+
+class RequestTimeout(RelayError):
+  pass
+
+class ConnectionLost(RelayError):
+  pass
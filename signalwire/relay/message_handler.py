@@ -2,11 +2,12 @@ import logging
 from .constants import BladeMethod
 
 def handle_inbound_message(client, message):
-  if message.method == BladeMethod.NETCAST:
+  method = getattr(message, 'method', None) # None for late responses of expired requests
+  if method == BladeMethod.NETCAST:
     pass
-  elif message.method == BladeMethod.BROADCAST:
+  elif method == BladeMethod.BROADCAST:
     _blade_broadcast(client, message.params)
-  elif message.method == BladeMethod.DISCONNECT:
+  elif method == BladeMethod.DISCONNECT:
     client._idle = True
 
 def _blade_broadcast(client, params):
@@ -1,6 +1,5 @@
 import logging
 from signalwire.blade.messages.execute import Execute
-from signalwire.blade.handler import trigger
 from signalwire.relay import BaseRelay
 from .message import Message
 from .send_result import SendResult
@@ -16,9 +15,9 @@ class Messaging(BaseRelay):
     notification['params']['event_type'] = notification['event_type']
     message = Message(notification['params'])
     if notification['event_type'] == Notification.STATE:
-      trigger(self.client.protocol, message, suffix=self.ctx_state_unique(message.context))
+      self.client.bus.trigger(self.client.protocol, message, suffix=self.ctx_state_unique(message.context))
     elif notification['event_type'] == Notification.RECEIVE:
-      trigger(self.client.protocol, message, suffix=self.ctx_receive_unique(message.context))
+      self.client.bus.trigger(self.client.protocol, message, suffix=self.ctx_receive_unique(message.context))
 
   async def send(self, *, from_number, to_number, context, body=None, media=None, tags=None):
     params = {
@@ -1,4 +1,6 @@
 class Message:
+  __slots__ = ('id', 'state', 'context', 'from_number', 'to_number', 'body', 'direction', 'media', 'segments', 'tags', 'reason')
+
   def __init__(self, params={}):
     self.id = params.get('message_id', None)
     self.state = params.get('message_state', None)
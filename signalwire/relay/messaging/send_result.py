@@ -1,4 +1,6 @@
 class SendResult:
+  __slots__ = ('successful', 'message_id')
+
   def __init__(self, result={}):
     self.successful = result.get('code', None) == '200'
     self.message_id = result.get('message_id', None)
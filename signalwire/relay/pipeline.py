@@ -0,0 +1,55 @@
+import asyncio
+from collections import OrderedDict
+
+class RequestPipeline:
+  # Requests safe to send twice: replayed when the socket drops before their response
+  IDEMPOTENT_METHODS = {'blade.ping', 'blade.subscription', 'signalwire.receive'}
+  IDEMPOTENT_SUFFIXES = ('.stop', '.pause', '.resume', '.volume')
+
+  def __init__(self):
+    self.queue = asyncio.Queue() # waiting for a ready connection, in execute order
+    self.inflight = OrderedDict() # written to the socket, waiting for the response
+
+  def enqueue(self, message):
+    self.queue.put_nowait(message)
+
+  def dequeue(self):
+    return None if self.queue.empty() else self.queue.get_nowait()
+
+  def sent(self, message):
+    self.inflight[message.id] = message
+
+  def done(self, uuid):
+    self.inflight.pop(uuid, None)
+
+  def recover(self):
+    replay = []
+    lost = []
+    for message in self.inflight.values():
+      (replay if self.is_idempotent(message) else lost).append(message)
+    self.inflight.clear()
+    # in-flight requests were sent before the queued ones: keep them first
+    while not self.queue.empty():
+      replay.append(self.queue.get_nowait())
+    for message in replay:
+      self.queue.put_nowait(message)
+    return lost
+
+  def rebind(self, old_protocol, new_protocol):
+    # queued and replayed requests were built for the previous session's protocol
+    queued = []
+    while not self.queue.empty():
+      queued.append(self.queue.get_nowait())
+    for message in queued:
+      params = getattr(message, 'params', None)
+      if isinstance(params, dict) and params.get('protocol') == old_protocol:
+        params['protocol'] = new_protocol
+      self.queue.put_nowait(message)
+
+  def is_idempotent(self, message):
+    method = getattr(message, 'method', None)
+    if method == 'blade.execute':
+      method = message.params.get('method', None)
+    if method is None:
+      return False
+    return method in self.IDEMPOTENT_METHODS or method.endswith(self.IDEMPOTENT_SUFFIXES)
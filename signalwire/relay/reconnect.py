@@ -0,0 +1,47 @@
+import random
+
+class CircuitState:
+  CLOSED = 'closed'
+  OPEN = 'open'
+  HALF_OPEN = 'half_open'
+
+# Delay before each reconnect: the first retry is immediate, the next ones wait a
+# random time between 0 and an exponentially growing cap (full jitter) so clients
+# dropped together do not reconnect in lockstep. After `failure_threshold`
+# consecutive failures the circuit opens and the client waits `cool_down` seconds
+# before a single half-open attempt.
+class ReconnectPolicy:
+  def __init__(self, base_delay=0.5, max_delay=30, failure_threshold=8, cool_down=60, rand=random.random):
+    self.base_delay = base_delay
+    self.max_delay = max_delay
+    self.failure_threshold = failure_threshold
+    self.cool_down = cool_down
+    self.failures = 0
+    self.state = CircuitState.CLOSED
+    self.on_state_change = None
+    self._rand = rand
+
+  def attempt(self):
+    if self.state == CircuitState.OPEN:
+      self._set_state(CircuitState.HALF_OPEN)
+
+  def success(self):
+    self.failures = 0
+    self._set_state(CircuitState.CLOSED)
+
+  def failure(self):
+    self.failures += 1
+    if self.state == CircuitState.HALF_OPEN or self.failures >= self.failure_threshold:
+      self._set_state(CircuitState.OPEN)
+      return self.cool_down
+    if self.failures == 1:
+      return 0
+    cap = min(self.max_delay, self.base_delay * 2 ** (self.failures - 2))
+    return self._rand() * cap
+
+  def _set_state(self, state):
+    if state == self.state:
+      return
+    self.state = state
+    if self.on_state_change is not None:
+      self.on_state_change(state)
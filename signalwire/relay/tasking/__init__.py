@@ -1,5 +1,4 @@
 import logging
-from signalwire.blade.handler import trigger
 from signalwire.relay import BaseRelay
 
 class Tasking(BaseRelay):
@@ -11,4 +10,4 @@ class Tasking(BaseRelay):
   def notification_handler(self, notification):
     context = notification['context']
     logging.info(f'Receive task in context: {context}')
-    trigger(self.client.protocol, notification['message'], suffix=self.ctx_receive_unique(context))
+    self.client.bus.trigger(self.client.protocol, notification['message'], suffix=self.ctx_receive_unique(context))
@@ -0,0 +1,78 @@
+import asyncio
+import heapq
+import math
+
+# Expire many keys with a single loop timer: deadlines are rounded up to
+# RESOLUTION seconds and grouped in slots so the loop only holds one TimerHandle
+# for the earliest slot, whatever the number of pending keys.
+class TimerWheel:
+  RESOLUTION = 0.1
+
+  def __init__(self, callback, loop=None):
+    self.callback = callback
+    self._loop = loop
+    self._slots = {} # tick -> {keys}
+    self._ticks = [] # heap of ticks, may hold ticks of emptied slots
+    self._keys = {} # key -> tick
+    self._handle = None
+    self._handle_tick = None
+
+  def __len__(self):
+    return len(self._keys)
+
+  def __contains__(self, key):
+    return key in self._keys
+
+  def add(self, key, timeout):
+    if self._loop is None:
+      self._loop = asyncio.get_event_loop()
+    self.discard(key)
+    tick = math.ceil((self._loop.time() + timeout) / self.RESOLUTION)
+    slot = self._slots.get(tick, None)
+    if slot is None:
+      slot = self._slots[tick] = set()
+      heapq.heappush(self._ticks, tick)
+    slot.add(key)
+    self._keys[key] = tick
+    if self._handle is None or tick < self._handle_tick:
+      self._schedule(tick)
+
+  def discard(self, key):
+    tick = self._keys.pop(key, None)
+    if tick is None:
+      return False
+    slot = self._slots[tick]
+    slot.discard(key)
+    if len(slot) == 0:
+      del self._slots[tick]
+    if len(self._keys) == 0:
+      self.clear()
+    return True
+
+  def clear(self):
+    if self._handle is not None:
+      self._handle.cancel()
+    self._handle = None
+    self._handle_tick = None
+    self._slots = {}
+    self._ticks = []
+    self._keys = {}
+
+  def _schedule(self, tick):
+    if self._handle is not None:
+      self._handle.cancel()
+    self._handle_tick = tick
+    self._handle = self._loop.call_at(tick * self.RESOLUTION, self._expire)
+
+  def _expire(self):
+    self._handle = None
+    now = self._loop.time()
+    while self._ticks and self._ticks[0] * self.RESOLUTION <= now:
+      slot = self._slots.pop(heapq.heappop(self._ticks), None)
+      for key in slot or ():
+        self._keys.pop(key, None)
+        self.callback(key)
+    while self._ticks and self._ticks[0] not in self._slots:
+      heapq.heappop(self._ticks)
+    if self._ticks:
+      self._schedule(self._ticks[0])
@@ -52,6 +52,10 @@ class TestBladeMessages(TestCase):
     msg.id = 'mocked'
     self.assertEqual(msg.to_json(), '{{"method":"blade.connect","jsonrpc":"2.0","id":"mocked","params":{{"version":{{"major":{0},"minor":{1},"revision":{2}}},"authentication":{{"project":"project","token":"token"}},"agent":"Python SDK/{3}"}}}}'.format(Connect.MAJOR, Connect.MINOR, Connect.REVISION, __version__))
 
+  def test_connect_with_sessionid(self):
+    msg = Connect(project='project', token='token', sessionid='previous-session')
+    self.assertEqual(msg.params['sessionid'], 'previous-session')
+
   def test_execute(self):
     msg = Execute({
       'protocol': 'proto',
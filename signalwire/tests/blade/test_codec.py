@@ -0,0 +1,36 @@
+import pytest
+from signalwire.blade import codec
+from signalwire.blade.codec import get_codec, JsonCodec
+from signalwire.blade.messages.message import Message
+
+AVAILABLE = [name for name, cls in codec._codecs.items() if cls is not None]
+
+def test_default_codec():
+  assert get_codec() is codec.default_codec
+  assert get_codec().name == AVAILABLE[0]
+
+def test_get_codec_instance():
+  instance = JsonCodec()
+  assert get_codec(instance) is instance
+
+def test_get_codec_unknown():
+  with pytest.raises(ValueError):
+    get_codec('simplejson')
+
+@pytest.mark.parametrize('name', AVAILABLE)
+def test_message_round_trip(name):
+  msg = Message(params={'test': 'hello world!', 'url': 'https://example.com/a.mp3', 'text': 'ciào'})
+  msg.id = 'mocked'
+  selected = get_codec(name)
+  data = msg.to_bytes(selected)
+  assert isinstance(data, bytes)
+  assert msg.to_json(selected) == data.decode('utf-8')
+  decoded = Message.from_json(data, selected)
+  assert decoded.id == 'mocked'
+  assert decoded.params == msg.params
+
+@pytest.mark.parametrize('name', AVAILABLE)
+def test_compact_output(name):
+  msg = Message(params={'test': 'hello world!'})
+  msg.id = 'mocked'
+  assert msg.to_json(name) == '{"jsonrpc":"2.0","id":"mocked","params":{"test":"hello world!"}}'
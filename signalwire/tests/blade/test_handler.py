@@ -1,6 +1,7 @@
+import gc
 from unittest import TestCase
 from unittest.mock import Mock
-from signalwire.blade.handler import register, register_once, unregister, unregister_all, trigger, queue_size, is_queued, clear
+from signalwire.blade.handler import EventBus, register, register_once, unregister, unregister_all, trigger, queue_size, is_queued, clear, handler_stats
 
 class TestBladeMessages(TestCase):
   def setUp(self):
@@ -107,3 +108,85 @@ class TestBladeMessages(TestCase):
     trigger('event_name', 'custom data', suffix='some_uuid')
     mock1.assert_called_once()
     mock2.assert_not_called()
+
+  def test_unregister_all_keeps_other_events(self):
+    mock = Mock()
+    register(event='event_name', callback=mock, suffix='t1')
+    register(event='event_name_other', callback=mock, suffix='t1')
+    unregister_all('event_name')
+    self.assertFalse(is_queued('event_name', 't1'))
+    self.assertTrue(trigger('event_name_other', 'custom data', suffix='t1'))
+    mock.assert_called_once()
+
+  def test_register_after_unregister_all(self):
+    mock = Mock()
+    register(event='event_name', callback=mock, suffix='t1')
+    unregister_all('event_name')
+    register(event='event_name', callback=mock, suffix='t1')
+    self.assertEqual(queue_size('event_name', 't1'), 1)
+    unregister_all('event_name')
+    self.assertEqual(queue_size('event_name', 't1'), 0)
+
+  def test_trigger_with_register_once_siblings(self):
+    mock1 = Mock()
+    mock2 = Mock()
+    register_once(event='event_name', callback=mock1)
+    register_once(event='event_name', callback=mock2)
+    trigger('event_name', 'custom data')
+    mock1.assert_called_once()
+    mock2.assert_called_once()
+    self.assertFalse(is_queued('event_name'))
+
+  def test_event_bus_isolation(self):
+    mock = Mock()
+    bus1 = EventBus()
+    bus2 = EventBus()
+    bus1.register(event='event_name', callback=mock)
+    self.assertFalse(bus2.trigger('event_name', 'custom data'))
+    self.assertFalse(is_queued('event_name'))
+    self.assertTrue(bus1.trigger('event_name', 'custom data'))
+    mock.assert_called_once()
+    bus1.clear()
+    self.assertEqual(bus1.queue_size('event_name'), 0)
+
+  def test_unregister_reclaims_bucket(self):
+    mock = Mock()
+    register(event='event_name', callback=mock, suffix='xxx')
+    unregister(event='event_name', callback=mock, suffix='xxx')
+    self.assertEqual(handler_stats()['buckets'], 0)
+
+  def test_register_weak(self):
+    class Component:
+      def __init__(self):
+        self.calls = 0
+      def handler(self, *args):
+        self.calls += 1
+
+    component = Component()
+    register(event='event_name', callback=component.handler, suffix='xxx', weak=True)
+    trigger('event_name', 'custom data', suffix='xxx')
+    self.assertEqual(component.calls, 1)
+    self.assertTrue(unregister(event='event_name', callback=component.handler, suffix='xxx'))
+    register(event='event_name', callback=component.handler, suffix='xxx', weak=True)
+    del component
+    gc.collect()
+    self.assertFalse(is_queued('event_name', 'xxx'))
+    self.assertEqual(handler_stats()['buckets'], 0)
+
+  def test_register_weak_temporary_function(self):
+    bus = EventBus()
+    bus.register(event='event_name', callback=lambda *args: None, suffix='xxx', weak=True)
+    gc.collect()
+    self.assertFalse(bus.is_queued('event_name', 'xxx'))
+    self.assertFalse(bus.trigger('event_name', suffix='xxx'))
+    self.assertEqual(bus.handler_stats()['handlers'], 0)
+
+  def test_handler_stats(self):
+    register(event='event_name', callback=Mock(), suffix='t1')
+    register(event='event_name', callback=Mock(), suffix='t2')
+    register(event='event_name', callback=Mock(), suffix='t2')
+    register(event='other_event', callback=Mock())
+    stats = handler_stats()
+    self.assertEqual(stats['buckets'], 3)
+    self.assertEqual(stats['handlers'], 4)
+    self.assertEqual(stats['top_prefixes'][0], ('event_name', 3))
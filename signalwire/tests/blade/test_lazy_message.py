@@ -0,0 +1,49 @@
+from unittest import TestCase
+from signalwire.blade.messages.lazy import LazyMessage
+
+class TestLazyMessage(TestCase):
+  def test_envelope_without_decoding(self):
+    msg = LazyMessage('{"jsonrpc":"2.0","id":"uuid","method":"blade.netcast","params":{"netcast":"route.add"}}')
+
+    self.assertEqual(msg.id, 'uuid')
+    self.assertEqual(msg.method, 'blade.netcast')
+    self.assertIsNotNone(msg._data)
+
+  def test_decode_on_access(self):
+    msg = LazyMessage('{"jsonrpc":"2.0","id":"uuid","method":"blade.broadcast","params":{"event":"relay.test"}}')
+
+    self.assertEqual(msg.params['event'], 'relay.test')
+    self.assertIsNone(msg._data)
+    self.assertFalse(hasattr(msg, 'error'))
+
+  def test_response(self):
+    msg = LazyMessage('{"jsonrpc":"2.0","id":"uuid","error":{"code":-32002,"message":"error description"}}')
+
+    self.assertEqual(msg.id, 'uuid')
+    self.assertTrue(hasattr(msg, 'error'))
+    self.assertFalse(hasattr(msg, 'method'))
+    self.assertFalse(hasattr(msg, 'result'))
+
+  def test_members_in_any_order(self):
+    msg = LazyMessage('{"params":{"id":"nested","method":"nested"},"method":"blade.broadcast","id":"uuid","jsonrpc":"2.0"}')
+
+    self.assertEqual(msg.id, 'uuid')
+    self.assertEqual(msg.method, 'blade.broadcast')
+    self.assertEqual(msg.params, {'id': 'nested', 'method': 'nested'})
+
+  def test_escaped_id(self):
+    msg = LazyMessage('{"jsonrpc":"2.0","id":"a\\"b","result":{}}')
+
+    self.assertEqual(msg.id, 'a"b')
+
+  def test_overridden_id_is_kept(self):
+    msg = LazyMessage('{"jsonrpc":"2.0","id":"uuid","result":{"code":"200"}}')
+    msg.id = 'other'
+
+    self.assertEqual(msg.result, {'code': '200'})
+    self.assertEqual(msg.id, 'other')
+
+  def test_to_json(self):
+    msg = LazyMessage('{"jsonrpc":"2.0","id":"uuid","result":{"code":"200"}}')
+
+    self.assertEqual(msg.to_json(), '{"jsonrpc":"2.0","id":"uuid","result":{"code":"200"}}')
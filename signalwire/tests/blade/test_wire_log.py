@@ -0,0 +1,39 @@
+import logging
+from signalwire.blade.wire_log import WireLog
+
+def test_ring_buffer_keeps_last_frames():
+  wire_log = WireLog(buffer_size=2)
+  wire_log.sent(b'{"id":"1"}')
+  wire_log.received('{"id":"2"}')
+  wire_log.sent(b'{"id":"3"}')
+  assert [frame[2] for frame in wire_log.frames] == ['{"id":"2"}', b'{"id":"3"}']
+  assert [frame[1] for frame in wire_log.frames] == ['RECV', 'SEND']
+
+def test_debug_log(caplog):
+  wire_log = WireLog()
+  with caplog.at_level(logging.DEBUG):
+    wire_log.sent(b'{"id":"1"}')
+  assert 'SEND: \n{"id":"1"}' in caplog.text
+
+def test_no_log_above_debug(caplog):
+  wire_log = WireLog()
+  with caplog.at_level(logging.INFO):
+    wire_log.sent(b'{"id":"1"}')
+  assert caplog.text == ''
+  assert len(wire_log.frames) == 1
+
+def test_sampling(caplog):
+  wire_log = WireLog(sample_rate=0)
+  with caplog.at_level(logging.DEBUG):
+    wire_log.received('{"id":"1"}')
+  assert caplog.text == ''
+
+def test_dump(caplog):
+  wire_log = WireLog()
+  wire_log.sent(b'{"id":"1"}')
+  wire_log.received('{"id":"2"}')
+  with caplog.at_level(logging.ERROR):
+    wire_log.dump()
+  assert 'Last 2 frames' in caplog.text
+  assert 'SEND: {"id":"1"}' in caplog.text
+  assert 'RECV: {"id":"2"}' in caplog.text
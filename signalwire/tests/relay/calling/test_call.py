@@ -100,3 +100,11 @@ async def test_dial_with_failure(fail_response, relay_call):
   result = await relay_call.dial()
   assert not result.successful
   relay_call.calling.client.execute.mock.assert_called_once()
+
+def test_hot_objects_have_no_instance_dict(relay_call):
+  from signalwire.relay.calling.components.play import Play
+  from signalwire.relay.calling.results.play_result import PlayResult
+  from signalwire.relay.calling.actions.play_action import PlayAction
+  component = Play(relay_call, [{ 'type': 'audio', 'url': 'audio.mp3' }])
+  for instance in [relay_call, component, PlayResult(component), PlayAction(component)]:
+    assert not hasattr(instance, '__dict__')
@@ -1,3 +1,4 @@
+import gc
 import asyncio
 import json
 import pytest
@@ -222,3 +223,15 @@ async def test_play_ringtone_async_with_success(success_response, relay_call):
     msg = relay_call.calling.client.execute.mock.call_args[0][0]
     assert msg.params == json.loads('{"protocol":"signalwire-proto-test","method":"calling.play","params":{"call_id":"call-id","node_id":"node-id","control_id":"control-id","play":[{"type":"ringtone","params":{"name":"us","duration":40}}]}}')
     relay_call.calling.client.execute.mock.assert_called_once()
+
+@pytest.mark.asyncio
+async def test_play_async_dropped_action_releases_handlers(success_response, relay_call):
+  with patch('signalwire.relay.calling.components.uuid4', mock_uuid):
+    relay_call.calling.client.execute = success_response
+    bus = relay_call.calling.client.bus
+    action = await relay_call.play_audio_async('audio.mp3')
+    assert bus.is_queued('calling.call.play', 'control-id')
+    del action
+    gc.collect()
+    assert not bus.is_queued('calling.call.play', 'control-id')
+    assert not bus.is_queued('call-id', 'ended')
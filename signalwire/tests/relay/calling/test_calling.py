@@ -58,3 +58,58 @@ async def test_on_state_ringing(relay_calling):
   message = Message.from_json('{"jsonrpc":"2.0","id":"uuid","method":"blade.broadcast","params":{"broadcaster_nodeid":"uuid","protocol":"signalwire-proto-test","channel":"notifications","event":"queuing.relay.events","params":{"event_type":"calling.call.state","event_channel":"signalwire-proto-test","timestamp":1569517309.4546909,"project_id":"project-uuid","space_id":"space-uuid","params":{"call_state":"ringing","direction":"outbound","device":{"type":"phone","params":{"from_number":"+12029999999","to_number":"+12028888888"}},"call_id":"call-id","node_id":"node-id","tag":"'+call.tag+'"}}}}')
   relay_calling.client.message_handler(message)
   assert call.state == 'ringing'
+
+def test_notification_handler_ignores_unknown_event(relay_calling):
+  relay_calling.notification_handler({'event_type': 'calling.call.unknown', 'params': {'call_id': 'call-id'}})
+
+def test_play_event_is_routed_to_its_call(relay_calling):
+  calls = [Call(calling=relay_calling, **{ 'call_id': f'call-{i}' }) for i in range(10)]
+  handler = Mock()
+  other_handler = Mock()
+  calls[3].on('play.finished', handler)
+  calls[4].on('play.finished', other_handler)
+  relay_calling.notification_handler({'event_type': 'calling.call.play', 'params': {'control_id': 'control-id', 'call_id': 'call-3', 'node_id': 'node-id', 'state': 'finished'}})
+  handler.assert_called_once()
+  other_handler.assert_not_called()
+  assert relay_calling.calls.route('call-3').call is calls[3]
+
+def test_calls_indexes(relay_client):
+  instance = Calling(relay_client)
+  c1 = Call(calling=instance, **{ 'call_id': '1234' })
+  c2 = Call(calling=instance)
+  assert list(instance.calls) == [c1, c2]
+  assert c2 in instance.calls
+  instance.remove_call(c1)
+  assert instance._get_call_by_id('1234') is None
+  assert instance._get_call_by_tag(c1.tag) is None
+  assert len(instance.calls) == 1
+
+@pytest.mark.asyncio
+async def test_on_state_indexes_dialed_call_id(relay_calling):
+  call = Call(calling=relay_calling)
+  assert relay_calling._get_call_by_id('call-id') is None
+  message = Message.from_json('{"jsonrpc":"2.0","id":"uuid","method":"blade.broadcast","params":{"broadcaster_nodeid":"uuid","protocol":"signalwire-proto-test","channel":"notifications","event":"queuing.relay.events","params":{"event_type":"calling.call.state","event_channel":"signalwire-proto-test","timestamp":1569517309.4546909,"project_id":"project-uuid","space_id":"space-uuid","params":{"call_state":"created","direction":"outbound","device":{"type":"phone","params":{"from_number":"+12029999999","to_number":"+12028888888"}},"call_id":"call-id","node_id":"node-id","tag":"'+call.tag+'"}}}}')
+  relay_calling.client.message_handler(message)
+  assert relay_calling._get_call_by_id('call-id') is call
+
+@pytest.mark.asyncio
+async def test_sweep_evicts_idle_calls(relay_calling):
+  relay_calling.CALL_IDLE_TTL = 0
+  call = Call(calling=relay_calling, **{ 'call_id': 'call-id', 'call_state': 'answered' })
+  assert relay_calling._sweeper is not None
+  ended = Mock()
+  call.on('ended', ended)
+  relay_calling._sweep()
+  ended.assert_called_once()
+  assert call.ended
+  assert relay_calling.call_stats() == { 'live': 0, 'evicted': 1 }
+  assert relay_calling._sweeper is None
+
+def test_sweep_keeps_active_calls(relay_client):
+  instance = Calling(relay_client)
+  instance.CALL_IDLE_TTL = 600
+  c1 = Call(calling=instance, **{ 'call_id': '1234' })
+  instance._sweep()
+  assert instance.call_stats() == { 'live': 1, 'evicted': 0 }
+  assert instance._sweeper is not None
+  instance._sweeper.cancel()
@@ -38,3 +38,145 @@ async def test_blade_disconnect(relay_client_to_connect):
   assert relay_client_to_connect._idle == False
   assert relay_client_to_connect._executeQueue.qsize() == 0
   assert result['test'] == 'done'
+
+@pytest.mark.asyncio
+async def test_reconnect_circuit_events(relay_client_to_connect):
+  from signalwire.relay.reconnect import ReconnectPolicy
+  client = relay_client_to_connect
+  client.reconnect_policy = ReconnectPolicy(failure_threshold=1)
+  client.reconnect_policy.on_state_change = client._circuit_changed
+  circuit_callback = Mock()
+  client.on('signalwire.socket.circuit', circuit_callback)
+  client.on_socket_open = AsyncMock()
+  client.connection.read = AsyncMock()
+  await client._connect()
+  circuit_callback.assert_called_once_with('open')
+
+def test_clients_do_not_share_handlers(relay_client):
+  other = Client(project='project', token='token', connection=MockedConnection)
+  callback = Mock()
+  relay_client.on('ready', callback)
+  other.bus.trigger('ready', other, suffix=other.uuid)
+  callback.assert_not_called()
+  relay_client.bus.trigger('ready', relay_client, suffix=relay_client.uuid)
+  callback.assert_called_once()
+
+def test_client_codec():
+  client = Client(project='project', token='token', connection=MockedConnection, codec='json')
+  assert client.codec.name == 'json'
+
+@pytest.mark.asyncio
+async def test_execute_timeout(relay_client):
+  from signalwire.relay.exceptions import RequestTimeout
+  message = Execute({ 'protocol': 'fake', 'method': 'testing', 'params': {} })
+  with pytest.raises(RequestTimeout):
+    await relay_client.execute(message, timeout=0.01)
+  assert message.id not in relay_client._requests
+  assert len(relay_client._timeouts) == 0
+
+@pytest.mark.asyncio
+async def test_late_response_is_ignored(relay_client):
+  late = Message.from_json('{"jsonrpc":"2.0","id":"expired","result":{"code":"200"}}')
+  relay_client.message_handler(late)
+
+@pytest.mark.asyncio
+async def test_socket_close_fails_inflight_requests(relay_client):
+  from signalwire.relay.exceptions import ConnectionLost
+  message = Execute({ 'protocol': 'fake', 'method': 'calling.play', 'params': {} })
+  task = asyncio.create_task(relay_client.execute(message))
+  await relay_client.connection.queue.get() # sent
+  relay_client.on_socket_close()
+  with pytest.raises(ConnectionLost):
+    await task
+  assert message.id not in relay_client._requests
+
+@pytest.mark.asyncio
+async def test_socket_close_replays_idempotent_requests(relay_client):
+  message = Execute({ 'protocol': 'fake', 'method': 'signalwire.receive', 'params': {} })
+  task = asyncio.create_task(relay_client.execute(message))
+  await relay_client.connection.queue.get() # sent
+  relay_client.on_socket_close()
+  assert relay_client._executeQueue.qsize() == 1
+
+  await relay_client._clearExecuteQueue()
+  assert await relay_client.connection.queue.get() == message.id # sent again
+  relay_client.message_handler(Message.from_json('{"jsonrpc":"2.0","id":"' + message.id + '","result":{"done":true}}'))
+  assert (await task)['done']
+
+@pytest.mark.asyncio
+async def test_execute_waits_for_setup(relay_client):
+  relay_client._opening = True
+  message = Execute({ 'protocol': 'fake', 'method': 'calling.play', 'params': {} })
+  task = asyncio.create_task(relay_client.execute(message))
+  await asyncio.wait([task], timeout=0.01)
+  assert relay_client._executeQueue.qsize() == 1
+  assert relay_client.connection.queue.empty()
+  task.cancel()
+
+@pytest.mark.asyncio
+async def test_socket_error_fails_inflight_requests(relay_client_to_connect):
+  from signalwire.relay.exceptions import ConnectionLost
+  client = relay_client_to_connect
+  message = Execute({ 'protocol': 'fake', 'method': 'calling.play', 'params': {} })
+  task = asyncio.create_task(client.execute(message))
+  await client.connection.queue.get() # sent
+  client.on_socket_open = AsyncMock()
+  client.connection.read = AsyncMock(side_effect=ConnectionResetError('reset by peer'))
+  await client._connect()
+  with pytest.raises(ConnectionLost):
+    await task
+
+@pytest.mark.asyncio
+async def test_connect_restores_session(relay_client):
+  sent = []
+  send = relay_client.connection.send
+  async def record_send(message):
+    sent.append(message)
+    await send(message)
+  relay_client.connection.send = record_send
+  relay_client.session_id = 'previous-session'
+  relay_client.protocol = 'signalwire_random_proto'
+  relay_client.contexts = ['office']
+  relay_client.connection.responses = [
+    '{"jsonrpc":"2.0","id":"uuid","result":{"session_restored":true,"sessionid":"previous-session","nodeid":"uuid_node","master_nodeid":"00000000-0000-0000-0000-000000000000","authorization":{"project":"project","expires_at":null,"scopes":["calling"],"signature":"random_signature"},"routes":[],"protocols":[],"subscriptions":[],"authorities":[],"authorizations":[],"accesses":[],"protocols_uncertified":["signalwire"]}}'
+  ]
+  ready_callback = Mock()
+  relay_client.on('ready', ready_callback)
+  await asyncio.gather(relay_client.connection.read(), relay_client.on_socket_open())
+  relay_client._pingInterval.cancel()
+  await relay_client.cancel_pending_tasks()
+
+  assert len(sent) == 2 # blade.connect and the first keepalive ping
+  assert sent[0].params['sessionid'] == 'previous-session'
+  assert relay_client.protocol == 'signalwire_random_proto'
+  assert relay_client.contexts == ['office']
+  ready_callback.assert_called_once()
+
+@pytest.mark.asyncio
+async def test_read_raw_frames(relay_client):
+  from aiohttp import WSMessage, WSMsgType
+  from signalwire.blade.connection import Connection
+  class FakeSocket:
+    closed = False
+    def __init__(self, frames):
+      self.frames = [WSMessage(WSMsgType.TEXT, frame, None) for frame in frames]
+    async def __aiter__(self):
+      for frame in self.frames:
+        yield frame
+
+  connection = Connection(relay_client, session=Mock)
+  connection.ws = FakeSocket([
+    '{"jsonrpc":"2.0","id":"request-ok","result":{"result":{"code":"200","message":"done"}}}',
+    '{"jsonrpc":"2.0","id":"request-ko","error":{"code":-32601,"message":"unknown method"}}',
+    '{"jsonrpc":"2.0","id":"broadcast","method":"blade.broadcast","params":{"protocol":"proto","event":"queuing.relay.events","params":{"event_type":"calling.call.state","params":{}}}}'
+  ])
+  relay_client.protocol = 'proto'
+  relay_client._calling = Mock()
+  ok = relay_client._requests['request-ok'] = relay_client.loop.create_future()
+  ko = relay_client._requests['request-ko'] = relay_client.loop.create_future()
+  await connection.read()
+
+  assert ok.result()['result']['message'] == 'done'
+  with pytest.raises(Exception, match='unknown method'):
+    ko.result()
+  relay_client._calling.notification_handler.assert_called_once_with({'event_type': 'calling.call.state', 'params': {}})
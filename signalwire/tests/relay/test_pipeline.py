@@ -0,0 +1,50 @@
+from signalwire.blade.messages.execute import Execute
+from signalwire.blade.messages.ping import Ping
+from signalwire.relay.pipeline import RequestPipeline
+
+def _execute(method):
+  return Execute({ 'protocol': 'proto', 'method': method, 'params': {} })
+
+def test_is_idempotent():
+  pipeline = RequestPipeline()
+  assert pipeline.is_idempotent(Ping())
+  assert pipeline.is_idempotent(_execute('signalwire.receive'))
+  assert pipeline.is_idempotent(_execute('calling.play.stop'))
+  assert not pipeline.is_idempotent(_execute('calling.play'))
+  assert not pipeline.is_idempotent(_execute('messaging.send'))
+
+def test_recover():
+  pipeline = RequestPipeline()
+  play = _execute('calling.play')
+  receive = _execute('signalwire.receive')
+  queued = _execute('calling.answer')
+  pipeline.sent(play)
+  pipeline.sent(receive)
+  pipeline.enqueue(queued)
+
+  lost = pipeline.recover()
+
+  assert lost == [play]
+  assert len(pipeline.inflight) == 0
+  assert pipeline.dequeue() is receive
+  assert pipeline.dequeue() is queued
+  assert pipeline.dequeue() is None
+
+def test_done():
+  pipeline = RequestPipeline()
+  play = _execute('calling.play')
+  pipeline.sent(play)
+  pipeline.done(play.id)
+  assert pipeline.recover() == []
+
+def test_rebind():
+  pipeline = RequestPipeline()
+  stale = _execute('signalwire.receive')
+  other = Execute({ 'protocol': 'signalwire', 'method': 'setup', 'params': {} })
+  pipeline.enqueue(stale)
+  pipeline.enqueue(other)
+
+  pipeline.rebind('proto', 'new_proto')
+
+  assert pipeline.dequeue().params['protocol'] == 'new_proto'
+  assert pipeline.dequeue().params['protocol'] == 'signalwire'
@@ -0,0 +1,35 @@
+from unittest.mock import Mock
+from signalwire.relay.reconnect import ReconnectPolicy, CircuitState
+
+def test_first_retry_is_immediate():
+  policy = ReconnectPolicy(rand=lambda: 1)
+  assert policy.failure() == 0
+
+def test_backoff_is_capped():
+  policy = ReconnectPolicy(base_delay=1, max_delay=5, failure_threshold=100, rand=lambda: 1)
+  delays = [policy.failure() for _ in range(6)]
+  assert delays == [0, 1, 2, 4, 5, 5]
+
+def test_full_jitter():
+  policy = ReconnectPolicy(base_delay=1, rand=lambda: 0.5)
+  policy.failure()
+  policy.failure()
+  assert policy.failure() == 1
+
+def test_circuit_opens_and_recovers():
+  listener = Mock()
+  policy = ReconnectPolicy(failure_threshold=3, cool_down=60, rand=lambda: 0)
+  policy.on_state_change = listener
+  policy.failure()
+  policy.failure()
+  assert policy.failure() == 60
+  assert policy.state == CircuitState.OPEN
+
+  policy.attempt()
+  assert policy.state == CircuitState.HALF_OPEN
+  assert policy.failure() == 60 # half-open attempt failed
+  policy.attempt()
+  policy.success()
+  assert policy.state == CircuitState.CLOSED
+  assert policy.failure() == 0
+  assert [c[0][0] for c in listener.call_args_list] == ['open', 'half_open', 'open', 'half_open', 'closed']
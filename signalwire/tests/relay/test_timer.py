@@ -0,0 +1,45 @@
+import pytest
+from unittest.mock import Mock
+from signalwire.relay.timer import TimerWheel
+
+# asyncio.sleep may be mocked by other tests: wait on the loop timers instead
+def _wait(loop, delay):
+  future = loop.create_future()
+  loop.call_later(delay, future.set_result, True)
+  return future
+
+@pytest.mark.asyncio
+async def test_expire_keys(event_loop):
+  callback = Mock()
+  wheel = TimerWheel(callback)
+  wheel.add('k1', 0.01)
+  wheel.add('k2', 0.01)
+  wheel.add('k3', 10)
+  assert len(wheel) == 3
+  await _wait(event_loop, 0.25)
+  assert sorted(c[0][0] for c in callback.call_args_list) == ['k1', 'k2']
+  assert 'k3' in wheel
+  assert wheel._handle is not None
+  wheel.clear()
+
+@pytest.mark.asyncio
+async def test_discard(event_loop):
+  callback = Mock()
+  wheel = TimerWheel(callback)
+  wheel.add('k1', 0.01)
+  assert wheel.discard('k1')
+  assert not wheel.discard('k1')
+  assert wheel._handle is None
+  await _wait(event_loop, 0.15)
+  callback.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_single_timer_handle():
+  wheel = TimerWheel(Mock())
+  for index in range(1000):
+    wheel.add(index, 5)
+  handle = wheel._handle
+  wheel.add('earlier', 1)
+  assert handle.cancelled()
+  assert len(wheel._ticks) <= 3
+  wheel.clear()